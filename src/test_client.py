@@ -0,0 +1,299 @@
+import asyncio
+import functools
+import json
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import vatify.client
+from vatify import Vatify, VatifyAsync, VatifyError, VatifyInputError
+
+CALCULATION = {"country_code": "FR", "applied_rate": 10.0, "net": 100.0, "vat": 10.0, "gross": 110.0,
+               "messages": [], "vat_check_status": "valid"}
+
+@pytest.fixture
+def api(monkeypatch):
+    # Only the transport is swapped out; clients still go through _ensure_client
+    routes = {}
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        route = routes[request.url.path]
+        if callable(route):
+            return route(request)
+        status, body = route
+        return httpx.Response(status, json=body)
+
+    transport = httpx.MockTransport(handler)
+    for name in ("Client", "AsyncClient"):
+        monkeypatch.setattr(httpx, name, functools.partial(getattr(httpx, name), transport=transport))
+    return SimpleNamespace(routes=routes, sent=sent)
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(vatify.client, "orjson", None)
+    elif vatify.client.orjson is None:
+        pytest.skip("orjson not installed")
+
+def calculate(client, **overrides):
+    kwargs = dict(amount=100, basis="net", rate_type="reduced", supply_date="2026-10-15",
+                  supplier={"country_code": "DE"}, customer={"country_code": "FR"},
+                  supply_type="services", b2x="B2B")
+    kwargs.update(overrides)
+    return client.calculate(**kwargs)
+
+def test_calculate_decimal_amount(api, serializer):
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+    with Vatify(api_key="test") as client:
+        calculate(client, amount=Decimal("100.00"))
+    assert json.loads(api.sent[0].content)["amount"] == 100.0
+
+def test_calculate_date_supply_date(api, serializer):
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+    with Vatify(api_key="test") as client:
+        calculate(client, supply_date=date(2026, 10, 15))
+    assert json.loads(api.sent[0].content)["supply_date"] == "2026-10-15"
+
+def test_default_headers(api):
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+    with Vatify(api_key="test") as client:
+        calculate(client)
+    headers = api.sent[0].headers
+    assert headers["Authorization"] == "Bearer test"
+    assert headers["Content-Type"] == "application/json"
+    assert headers["Accept-Encoding"] == "br, gzip"
+
+def test_headers_built_once_and_rebuilt_on_new_api_key(api):
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+    client = Vatify(api_key="old")
+    headers = client._headers
+    with client:
+        calculate(client)
+    with client:
+        calculate(client)
+    assert client._headers is headers
+    client.api_key = "new"
+    with client:
+        calculate(client)
+    assert [r.headers["Authorization"] for r in api.sent] == ["Bearer old", "Bearer old", "Bearer new"]
+
+@pytest.mark.parametrize("status", [302, 422, 500])
+def test_error_status_raises(api, status):
+    api.routes["/v1/calculate"] = (status, {"detail": "nope"})
+    with Vatify(api_key="test") as client:
+        with pytest.raises(VatifyError) as exc:
+            calculate(client)
+    assert exc.value.status_code == status
+    assert str(exc.value).startswith("Calculation failed")
+    assert len(api.sent) == 1
+
+def msgspec_clients():
+    msgspec_client = pytest.importorskip("vatify.msgspec_client")
+    return msgspec_client.VatifyMsgspec, msgspec_client.VatifyMsgspecAsync
+
+# (sync class, async class, constructor kwargs) for each decoding mode
+MODES = {
+    "trusted": lambda: (Vatify, VatifyAsync, {}),
+    "validated": lambda: (Vatify, VatifyAsync, {"validate_responses": True}),
+    "msgspec": lambda: (*msgspec_clients(), {}),
+}
+
+@pytest.fixture(params=list(MODES))
+def mode(request):
+    return MODES[request.param]()
+
+def calculate_many(client, lines=({"amount": 100},), **overrides):
+    kwargs = dict(basis="net", supply_date="2026-10-15", supplier={"country_code": "DE"},
+                  customer={"country_code": "FR"}, supply_type="services", b2x="B2B")
+    kwargs.update(overrides)
+    return client.calculate_many(list(lines), **kwargs)
+
+@pytest.mark.parametrize("body", [{"results": [CALCULATION]}, [CALCULATION]])
+def test_calculate_many_batch(api, mode, body):
+    sync_cls, _, kwargs = mode
+    api.routes["/v1/calculate:batch"] = (200, body)
+    with sync_cls(api_key="test", **kwargs) as client:
+        results = calculate_many(client)
+    assert [r.country_code for r in results] == ["FR"]
+    assert [r.applied_rate for r in results] == [10.0]
+
+@pytest.mark.parametrize("body", [{"results": [CALCULATION]}, [CALCULATION]])
+def test_async_calculate_many_batch(api, mode, body):
+    _, async_cls, kwargs = mode
+    api.routes["/v1/calculate:batch"] = (200, body)
+
+    async def run():
+        async with async_cls(api_key="test", **kwargs) as client:
+            return await calculate_many(client)
+    results = asyncio.run(run())
+    assert [r.country_code for r in results] == ["FR"]
+    assert [r.applied_rate for r in results] == [10.0]
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_calculate_many_falls_back_without_batch_endpoint(api, mode, status):
+    sync_cls, _, kwargs = mode
+    api.routes["/v1/calculate:batch"] = (status, {"detail": "not found"})
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+    lines = [{"amount": 100}, {"amount": 50, "rate_type": "standard", "category_hint": "food"}]
+    with sync_cls(api_key="test", **kwargs) as client:
+        first = calculate_many(client, lines)
+        second = calculate_many(client, lines)
+    assert len(first) == len(second) == 2
+    paths = [r.url.path for r in api.sent]
+    assert paths.count("/v1/calculate:batch") == 1
+    assert paths.count("/v1/calculate") == 4
+    bodies = sorted((json.loads(r.content) for r in api.sent[1:3]), key=lambda b: b["amount"])
+    assert [(b["amount"], b["rate_type"], b["category_hint"]) for b in bodies] == [
+        (50, "standard", "food"), (100, "standard", None)]
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_async_calculate_many_falls_back_without_batch_endpoint(api, mode, status):
+    _, async_cls, kwargs = mode
+    api.routes["/v1/calculate:batch"] = (status, {"detail": "not found"})
+    api.routes["/v1/calculate"] = (200, CALCULATION)
+
+    async def run():
+        async with async_cls(api_key="test", **kwargs) as client:
+            return await calculate_many(client), await calculate_many(client)
+    first, second = asyncio.run(run())
+    assert len(first) == len(second) == 1
+    assert [r.url.path for r in api.sent] == ["/v1/calculate:batch", "/v1/calculate", "/v1/calculate"]
+
+@pytest.mark.parametrize("status", [400, 422, 500])
+def test_calculate_many_reraises_other_errors(api, status):
+    api.routes["/v1/calculate:batch"] = (status, {"detail": "nope"})
+    with Vatify(api_key="test") as client:
+        with pytest.raises(VatifyError) as exc:
+            calculate_many(client)
+        assert client._batch_supported
+    assert exc.value.status_code == status
+    assert [r.url.path for r in api.sent] == ["/v1/calculate:batch"]
+
+@pytest.mark.parametrize("status", [400, 422, 500])
+def test_async_calculate_many_reraises_other_errors(api, status):
+    api.routes["/v1/calculate:batch"] = (status, {"detail": "nope"})
+
+    async def run():
+        async with VatifyAsync(api_key="test") as client:
+            with pytest.raises(VatifyError) as exc:
+                await calculate_many(client)
+            assert client._batch_supported
+        return exc.value
+    assert asyncio.run(run()).status_code == status
+    assert [r.url.path for r in api.sent] == ["/v1/calculate:batch"]
+
+RATES = {"country": "DE", "standard_rate": "19", "reduced_rates": [{"rate": 7.0, "label": "reduced"}]}
+
+def test_rates_cached_within_ttl(api, mode):
+    sync_cls, _, kwargs = mode
+    api.routes["/v1/rates/DE"] = (200, {"rates": RATES})
+    with sync_cls(api_key="test", **kwargs) as client:
+        first = client.rates("DE")
+        assert client.rates("de") is first
+    assert len(api.sent) == 1
+    assert first.reduced_rates[0].rate == 7.0
+
+def test_rates_refetched_when_ttl_is_zero(api):
+    api.routes["/v1/rates/DE"] = (200, RATES)
+    with Vatify(api_key="test", cache_ttl=0) as client:
+        client.rates("DE")
+        client.rates("DE")
+    assert len(api.sent) == 2
+
+def test_rates_refetched_after_expiry(api, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(vatify.client, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    api.routes["/v1/rates/DE"] = (200, RATES)
+    with Vatify(api_key="test", cache_ttl=60) as client:
+        client.rates("DE")
+        now[0] += 59
+        client.rates("DE")
+        assert len(api.sent) == 1
+        now[0] += 1
+        client.rates("DE")
+    assert len(api.sent) == 2
+
+def test_invalidate_rates_cache(api):
+    api.routes["/v1/rates/DE"] = (200, RATES)
+    api.routes["/v1/rates/FR"] = (200, dict(RATES, country="FR"))
+    with Vatify(api_key="test") as client:
+        client.rates("DE")
+        client.rates("FR")
+        client.invalidate_rates_cache("de")
+        client.rates("DE")
+        client.rates("FR")
+        assert [r.url.path for r in api.sent] == ["/v1/rates/DE", "/v1/rates/FR", "/v1/rates/DE"]
+        client.invalidate_rates_cache()
+        client.rates("DE")
+        client.rates("FR")
+    assert len(api.sent) == 5
+
+def test_async_rates_concurrent_calls_fetch_once(api, mode):
+    _, async_cls, kwargs = mode
+
+    async def slow_rates(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=RATES)
+    api.routes["/v1/rates/DE"] = slow_rates
+
+    async def run():
+        async with async_cls(api_key="test", **kwargs) as client:
+            first, second = await asyncio.gather(client.rates("DE"), client.rates("de"))
+            client.invalidate_rates_cache("DE")
+            third = await client.rates("DE")
+        return first, second, third
+    first, second, third = asyncio.run(run())
+    assert first is second
+    assert third is not first
+    assert len(api.sent) == 2
+
+VALIDATION = {"vat_number": "DE123456789", "valid": True, "country_code": "DE"}
+
+def test_validate_vat_normalizes_number(api):
+    api.routes["/v1/validate-vat"] = (200, VALIDATION)
+    with Vatify(api_key="test") as client:
+        assert client.validate_vat("de 123456789").valid
+    assert api.sent[0].content == b'{"vat_number":"DE123456789"}'
+
+@pytest.mark.parametrize("vat_number", ["DE1", "DE12345678é", "DE123456789\n", "D", "DE1234567890123", '"DE123"'])
+def test_validate_vat_rejects_malformed_number(api, vat_number):
+    with Vatify(api_key="test") as client:
+        with pytest.raises(VatifyInputError):
+            client.validate_vat(vat_number)
+    assert api.sent == []
+
+def test_async_validate_vat_rejects_malformed_number(api):
+    async def run():
+        async with VatifyAsync(api_key="test") as client:
+            await client.validate_vat("DE1")
+    with pytest.raises(VatifyInputError):
+        asyncio.run(run())
+    assert api.sent == []
+
+def test_rates_normalizes_country_code(api):
+    api.routes["/v1/rates/DE"] = (200, RATES)
+    with Vatify(api_key="test") as client:
+        client.rates("de")
+    assert api.sent[0].url.path == "/v1/rates/DE"
+
+@pytest.mark.parametrize("country_code", ["D", "DEU", "D1", "ÄT", "DE\n", "../"])
+def test_rates_rejects_malformed_country_code(api, country_code):
+    with Vatify(api_key="test") as client:
+        with pytest.raises(VatifyInputError):
+            client.rates(country_code)
+        with pytest.raises(VatifyInputError):
+            client.invalidate_rates_cache(country_code)
+    assert api.sent == []
+
+def test_async_rates_rejects_malformed_country_code(api):
+    async def run():
+        async with VatifyAsync(api_key="test") as client:
+            await client.rates("DEU")
+    with pytest.raises(VatifyInputError):
+        asyncio.run(run())
+    assert api.sent == []
@@ -1,11 +1,18 @@
+import os
+from datetime import date
+from vatify import Vatify
+
+# One client for the whole module so every test reuses the same keep-alive connection
+client = Vatify(api_key=os.getenv("VATIFY_API_KEY"))
+
+def teardown_module(module):
+    client.close()
+
 def test_import():
     import vatify
     assert hasattr(vatify, "Vatify")
 
 def test_validate():
-    from vatify import Vatify
-    import os
-    client = Vatify(api_key=os.getenv("VATIFY_API_KEY"))
     try:
         res = client.validate_vat("DE123456789")
         assert not res.valid
@@ -13,20 +20,17 @@ def test_validate():
         print(f"Error occurred: {e.status_code}, {e.details}")
 
 def test_rates():
-    from vatify import Vatify
-    import os
-    client = Vatify(api_key=os.getenv("VATIFY_API_KEY"))
     res = client.rates("DE")
     assert len(res.reduced_rates) > 0
     assert res.country == "DE"
     assert res.standard_rate != ""
 
+def test_connection_reuse():
+    client.validate_vat("DE123456789")
+    client.validate_vat("DE123456789")
+    assert len(client._client._transport._pool.connections) == 1
 
 def test_calculate():
-    from vatify import Vatify
-    from datetime import date
-    import os
-    client = Vatify(api_key=os.getenv("VATIFY_API_KEY"))
     try:
         res = client.calculate(amount=100, basis="net", rate_type="reduced", supply_date=str(date.today().isoformat()),
                            supplier={"country_code": "DE", "vat_number": "DE811907980"},
@@ -40,4 +44,5 @@ def test_calculate():
 test_import()
 test_validate()
 test_rates()
+test_connection_reuse()
 test_calculate()
\ No newline at end of file
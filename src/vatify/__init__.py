@@ -1,11 +1,16 @@
-from .client import Vatify, VatifyAsync, VatifyError, ValidationResult, CalculationRequest, CalculationResult, Rate
+from .client import Vatify, VatifyAsync, VatifyError, VatifyInputError, ValidationResult, Supplier, CalculationRequest, CalculationResult, CalcLine, CalculationBatch, Rate, Rates
 
 __all__ = [
     "Vatify",
     "VatifyAsync",
     "VatifyError",
+    "VatifyInputError",
     "ValidationResult",
+    "Supplier",
     "CalculationRequest",
     "CalculationResult",
+    "CalcLine",
+    "CalculationBatch",
     "Rate",
+    "Rates",
 ]
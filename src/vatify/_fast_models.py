@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Union
+import msgspec
+
+# msgspec mirrors of the response models in client.py, used by the clients in
+# msgspec_client.py. Decoding validates types like pydantic does but
+# goes straight from bytes to Struct instances.
+
+# ---------- Models ----------
+class FastValidationResult(msgspec.Struct, kw_only=True):
+    vat_number: str
+    valid: bool
+    country_code: Optional[str] = None
+    name: Optional[str] = None
+    address: Optional[str] = None
+    meta: Dict[str, Any] = {}
+
+class FastCalculationResult(msgspec.Struct, kw_only=True):
+    country_code: str
+    applied_rate: float
+    net: float
+    vat: float
+    gross: float
+    mechanism: Optional[str] = None
+    messages: List[str]
+    vat_check_status: str
+
+class FastRate(msgspec.Struct):
+    rate: float
+    label: str
+
+class FastRates(msgspec.Struct):
+    country: str
+    standard_rate: str
+    reduced_rates: List[FastRate]
+
+# msgspec can't tell two object-shaped Structs apart in a Union, so the
+# {"rates": {...}} envelope and the bare payload are decoded as one flat shape
+class _FastRatesResponse(msgspec.Struct):
+    rates: Optional[FastRates] = None
+    country: Optional[str] = None
+    standard_rate: Optional[str] = None
+    reduced_rates: Optional[List[FastRate]] = None
+
+class _FastCalculationListEnvelope(msgspec.Struct):
+    results: List[FastCalculationResult]
+
+# ---------- Decoders ----------
+_VALIDATION_DECODER = msgspec.json.Decoder(FastValidationResult)
+_CALCULATION_DECODER = msgspec.json.Decoder(FastCalculationResult)
+_RATES_DECODER = msgspec.json.Decoder(_FastRatesResponse)
+_CALCULATION_LIST_DECODER = msgspec.json.Decoder(Union[_FastCalculationListEnvelope, List[FastCalculationResult]])
+
+def decode_validation(raw: bytes) -> FastValidationResult:
+    return _VALIDATION_DECODER.decode(raw)
+
+def decode_calculation(raw: bytes) -> FastCalculationResult:
+    return _CALCULATION_DECODER.decode(raw)
+
+def decode_calculation_list(raw: bytes) -> List[FastCalculationResult]:
+    data = _CALCULATION_LIST_DECODER.decode(raw)
+    return data.results if isinstance(data, _FastCalculationListEnvelope) else data
+
+def decode_rates(raw: bytes) -> FastRates:
+    data = _RATES_DECODER.decode(raw)
+    if data.rates is not None:
+        return data.rates
+    if data.country is None or data.standard_rate is None or data.reduced_rates is None:
+        raise msgspec.ValidationError("Expected `object` with `country`, `standard_rate` and `reduced_rates`")
+    return FastRates(country=data.country, standard_rate=data.standard_rate, reduced_rates=data.reduced_rates)
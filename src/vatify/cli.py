@@ -2,7 +2,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from .client import Vatify, VatifyError
+from .client import Vatify, VatifyError, VatifyInputError
 
 def main() -> None:
     parser = argparse.ArgumentParser(prog="vatify", description="Vatify CLI")
@@ -25,7 +25,8 @@ def main() -> None:
         print("Missing API key. Use --api-key or set VATIFY_API_KEY.", file=sys.stderr)
         sys.exit(2)
 
-    client = Vatify(api_key=args.api_key)
+    # CLI input and output go straight to/from users, so keep full validation on
+    client = Vatify(api_key=args.api_key, validate_responses=True, validate_requests=True)
     try:
         if args.cmd == "validate":
             res = client.validate_vat(args.vat_number)
@@ -39,5 +40,8 @@ def main() -> None:
     except VatifyError as e:
         print(f"Error: {e} (status={e.status_code})", file=sys.stderr)
         sys.exit(1)
+    except VatifyInputError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
     finally:
         client.close()
@@ -1,11 +1,80 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import asyncio
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date
-from typing import Literal, Optional, Dict, Any, List
+from decimal import Decimal
+from typing import Generic, Literal, Optional, Dict, Any, Iterable, List, Tuple, TypeVar, Union
 import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 DEFAULT_BASE_URL = "https://api.vatifytax.app"
+KEEPALIVE_EXPIRY = 30.0
+DEFAULT_CONCURRENCY = 32
+
+def _pool_limits(max_connections: int, max_keepalive: int) -> httpx.Limits:
+    # Keep warm connections around so repeated calls skip the TCP+TLS handshake
+    return httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive, keepalive_expiry=KEEPALIVE_EXPIRY)
+
+def _default_headers(api_key: str) -> httpx.Headers:
+    # Built once per Vatify instance and reused when the httpx client is recreated;
+    # _client_headers() rebuilds them only if api_key was changed in between
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "User-Agent": "vatify-python/0.1",
+        "Content-Type": "application/json",
+        "Accept-Encoding": "br, gzip",
+    })
+
+_VAT_RE = re.compile(r"[A-Z]{2}[A-Z0-9]{2,12}")
+
+def _vat_body(vat_number: str) -> bytes:
+    vat_number = vat_number.replace(" ", "").upper()
+    if not _VAT_RE.fullmatch(vat_number):
+        raise VatifyInputError(f"vat_number must be a country prefix followed by 2-12 letters/digits, got {vat_number!r}")
+    # The body shape is fixed and the regex admits only [A-Z0-9], so no JSON escaping is needed
+    return b'{"vat_number":"%b"}' % vat_number.encode("ascii")
+
+def _normalize_country_code(country_code: str) -> str:
+    if len(country_code) != 2 or not (country_code.isascii() and country_code.isalpha()):
+        raise VatifyInputError(f"country_code must be a two-letter ISO code, got {country_code!r}")
+    return country_code.upper()
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+def _cache_get(cache: Dict[str, Tuple[float, Any]], key: str, ttl: float) -> Any:
+    entry = cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def _json_default(obj: Any) -> Any:
+    # Unvalidated payloads may carry the caller's own types (Decimal amounts, date objects)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 # ---------- Models ----------
 class ValidationResult(BaseModel):
@@ -34,6 +103,23 @@ class CalculationRequest(BaseModel):
 
 
 
+class CalcLine(BaseModel):
+    amount: float = Field(..., gt=0, description="Eingabebetrag (net oder gross)")
+    rate_type: Literal["standard", "reduced", "super_reduced", "parking", "zero"] = "standard"
+    category_hint: Optional[str] = Field(None, description="z.B. ebooks, hospitality, food")
+
+
+class CalculationBatch(BaseModel):
+    basis: Literal["net", "gross"] = "net"
+    supply_date: str
+    supplier: Supplier
+    customer: Supplier
+    supply_type: Literal["goods", "services"] = "goods"
+    b2x: Literal["B2C", "B2B"] = "B2C"
+    lines: List[CalcLine]
+
+
+
 class CalculationResult(BaseModel):
     country_code: str
     applied_rate: float
@@ -53,6 +139,64 @@ class Rates(BaseModel):
     standard_rate: str
     reduced_rates: List[Rate]
 
+# The rates endpoint answers either {"rates": ...} or the bare payload
+class _RatesEnvelope(BaseModel):
+    rates: Rates
+
+# The batch endpoint answers either {"results": [...]} or a bare list
+class _CalculationListEnvelope(BaseModel):
+    results: List[CalculationResult]
+
+# Built once at import; TypeAdapter construction compiles a full validator
+_RATES_ADAPTER = TypeAdapter(Union[_RatesEnvelope, Rates])
+_CALCULATION_LIST_ADAPTER = TypeAdapter(Union[_CalculationListEnvelope, List[CalculationResult]])
+
+# ---------- Trusted fast path ----------
+# model_construct skips validation entirely; only used for server responses
+# when the client was created with validate_responses=False.
+def _fast_list_construct(cls: type[BaseModel], items: List[Dict[str, Any]]) -> List[Any]:
+    return [cls.model_construct(**r) for r in items]
+
+def _unwrap_rates(data: Any) -> Any:
+    return data["rates"] if isinstance(data, dict) and "rates" in data else data
+
+def _unwrap_results(data: Any) -> Any:
+    return data["results"] if isinstance(data, dict) and "results" in data else data
+
+def _construct_rates(data: Any) -> Rates:
+    items = _unwrap_rates(data)
+    return Rates.model_construct(
+        country=items["country"],
+        standard_rate=items["standard_rate"],
+        reduced_rates=_fast_list_construct(Rate, items["reduced_rates"]),
+    )
+
+# ---------- Request payloads ----------
+def _calculation_payload(validate: bool, **fields: Any) -> Dict[str, Any]:
+    # Arguments are already typed at the call site; CalculationRequest is only
+    # built when the caller asked for request validation.
+    if validate:
+        return CalculationRequest(**fields).model_dump()
+    for key in ("supplier", "customer"):
+        if isinstance(fields[key], BaseModel):
+            fields[key] = fields[key].model_dump()
+    return fields
+
+def _calc_lines(lines: Iterable[Union[CalcLine, Dict[str, Any]]]) -> List[CalcLine]:
+    # Applies CalcLine defaults up front so the batch body and the per-line
+    # fallback see exactly the same input
+    return [line if isinstance(line, CalcLine) else CalcLine.model_validate(line) for line in lines]
+
+def _calculation_batch_payload(validate: bool, lines: List[CalcLine], **fields: Any) -> Dict[str, Any]:
+    # Shared fields once, per-line fields in "lines": one body for many items
+    if validate:
+        return CalculationBatch(lines=lines, **fields).model_dump()
+    for key in ("supplier", "customer"):
+        if isinstance(fields[key], BaseModel):
+            fields[key] = fields[key].model_dump()
+    fields["lines"] = [line.model_dump() for line in lines]
+    return fields
+
 # ---------- Errors ----------
 class VatifyError(Exception):
     def __init__(self, message: str, status_code: Optional[int] = None, details: Any = None):
@@ -60,21 +204,129 @@ class VatifyError(Exception):
         self.status_code = status_code
         self.details = details
 
+    def __str__(self) -> str:
+        message = super().__str__()
+        if not self.details:
+            return message
+        # Response bodies are kept as raw bytes and only decoded when shown
+        details = self.details.decode("utf-8", errors="replace") if isinstance(self.details, bytes) else self.details
+        return f"{message}: {details}"
+
+# Raised before any request is sent when a VAT number or country code is malformed
+class VatifyInputError(ValueError):
+    pass
+
+_ERROR_MESSAGES = (
+    ("/v1/validate-vat", "Validation failed"),
+    ("/v1/calculate", "Calculation failed"),
+    ("/v1/rates/", "Fetching rates failed"),
+)
+
+def _error_message(request: httpx.Request) -> str:
+    path = request.url.path
+    for endpoint, message in _ERROR_MESSAGES:
+        if endpoint in path:
+            return message
+    return "Request failed"
+
+# Response event hooks: redirects are not followed, so any 3xx is as unexpected as a 4xx/5xx
+def _check_status(resp: httpx.Response) -> None:
+    if resp.status_code >= 300:
+        resp.read()
+        raise VatifyError(_error_message(resp.request), resp.status_code, resp.content)
+
+async def _acheck_status(resp: httpx.Response) -> None:
+    if resp.status_code >= 300:
+        await resp.aread()
+        raise VatifyError(_error_message(resp.request), resp.status_code, resp.content)
+
+# ---------- Response decoding ----------
+# The clients below are generic over the result types (validation, calculation,
+# rates); a decoding mixin fills in how raw response bodies become those types.
+# Vatify/VatifyAsync decode into the pydantic models, vatify.msgspec_client
+# into msgspec Structs.
+_V = TypeVar("_V")
+_C = TypeVar("_C")
+_R = TypeVar("_R")
+
+class _PydanticDecoding:
+    validate_responses: bool
+
+    # Map permissively in case API adds fields
+    def _decode_validation(self, raw: bytes) -> ValidationResult:
+        if self.validate_responses:
+            return ValidationResult.model_validate_json(raw)
+        return ValidationResult.model_construct(**_loads(raw))
+
+    def _decode_calculation(self, raw: bytes) -> CalculationResult:
+        if self.validate_responses:
+            return CalculationResult.model_validate_json(raw)
+        return CalculationResult.model_construct(**_loads(raw))
+
+    # Accept either {"results":[...]} or the raw list
+    def _decode_calculation_list(self, raw: bytes) -> List[CalculationResult]:
+        if not self.validate_responses:
+            return _fast_list_construct(CalculationResult, _unwrap_results(_loads(raw)))
+        data = _CALCULATION_LIST_ADAPTER.validate_json(raw)
+        return data.results if isinstance(data, _CalculationListEnvelope) else data
+
+    # Accept either {"rates":{...}} or the raw object
+    def _decode_rates(self, raw: bytes) -> Rates:
+        if not self.validate_responses:
+            return _construct_rates(_loads(raw))
+        data = _RATES_ADAPTER.validate_json(raw)
+        return data.rates if isinstance(data, _RatesEnvelope) else data
+
 # ---------- Sync Client ----------
+_SyncSelf = TypeVar("_SyncSelf", bound="_VatifyBase[Any, Any, Any]")
+
 @dataclass
-class Vatify:
+class _VatifyBase(Generic[_V, _C, _R]):
     api_key: str
     base_url: str = DEFAULT_BASE_URL
     timeout: float = 10.0
+    max_connections: int = 100
+    max_keepalive: int = 20
+    validate_responses: bool = False
+    validate_requests: bool = False
+    cache_ttl: float = 3600.0
     _client: Optional[httpx.Client] = None
+    _headers: httpx.Headers = field(init=False, repr=False)
+    _headers_api_key: str = field(init=False, repr=False)
+    _batch_supported: bool = field(default=True, init=False, repr=False)
+    _rates_cache: Dict[str, Tuple[float, _R]] = field(default_factory=dict, init=False, repr=False)
+    _rate_urls: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._headers = _default_headers(self.api_key)
+        self._headers_api_key = self.api_key
+
+    def _client_headers(self) -> httpx.Headers:
+        if self._headers_api_key != self.api_key:
+            self.__post_init__()
+        return self._headers
+
+    def _decode_validation(self, raw: bytes) -> _V:
+        raise NotImplementedError
+
+    def _decode_calculation(self, raw: bytes) -> _C:
+        raise NotImplementedError
+
+    def _decode_calculation_list(self, raw: bytes) -> List[_C]:
+        raise NotImplementedError
+
+    def _decode_rates(self, raw: bytes) -> _R:
+        raise NotImplementedError
 
     def _ensure_client(self) -> httpx.Client:
         if self._client is None:
             self._client = httpx.Client(
                 base_url=self.base_url,
                 timeout=self.timeout,
-                headers={"Authorization": f"Bearer {self.api_key}", "User-Agent": "vatify-python/0.1"},
-                follow_redirects=True,
+                headers=self._client_headers(),
+                limits=_pool_limits(self.max_connections, self.max_keepalive),
+                http2=True,
+                event_hooks={"response": [_check_status]},
             )
         return self._client
 
@@ -83,64 +335,150 @@ class Vatify:
             self._client.close()
             self._client = None
 
+    def __enter__(self: _SyncSelf) -> _SyncSelf:
+        self._ensure_client()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
     # POST /v1/validate-vat  body {"vat_number":"..."}
-    def validate_vat(self, vat_number: str) -> ValidationResult:
+    def validate_vat(self, vat_number: str) -> _V:
         c = self._ensure_client()
         try:
-            resp = c.post("/v1/validate-vat", json={"vat_number": vat_number})
-            if resp.status_code >= 400:
-                raise VatifyError("Validation failed", resp.status_code, resp.text)
-            data = resp.json()
-            # Map permissively in case API adds fields
-            return ValidationResult(**data)
+            resp = c.post("/v1/validate-vat", content=_vat_body(vat_number))
+            return self._decode_validation(resp.content)
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
 
+    # Fans out over a thread pool; httpx.Client is thread-safe and shares its pool
+    def validate_vats(self, numbers: Iterable[str], *, concurrency: int = DEFAULT_CONCURRENCY) -> List[_V]:
+        _check_concurrency(concurrency)
+        self._ensure_client()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(self.validate_vat, numbers))
+
     # POST /v1/calculate  body {"country_code":"...","rate_type":"...","supply_date":"..."}
-    def calculate(self, *, amount: float, basis: str, rate_type: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, category_hint: Optional[str] = None) -> CalculationResult:
+    def calculate(self, *, amount: float, basis: str, rate_type: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, category_hint: Optional[str] = None) -> _C:
         c = self._ensure_client()
-        payload = CalculationRequest(amount=amount, basis=basis, rate_type=rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=category_hint).model_dump()
+        payload = _calculation_payload(self.validate_requests, amount=amount, basis=basis, rate_type=rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=category_hint)
         try:
-            resp = c.post("/v1/calculate", json=payload)
-            if resp.status_code >= 400:
-                raise VatifyError("Calculation failed", resp.status_code, resp.text)
-            return CalculationResult(**resp.json())
+            resp = c.post("/v1/calculate", content=_dumps(payload))
+            return self._decode_calculation(resp.content)
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
 
+    # POST /v1/calculate:batch  body {"supplier":{...},"customer":{...},...,"lines":[...]}
+    def calculate_many(self, lines: Iterable[Union[CalcLine, Dict[str, Any]]], *, basis: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, concurrency: int = DEFAULT_CONCURRENCY) -> List[_C]:
+        _check_concurrency(concurrency)
+        calc_lines = _calc_lines(lines)
+        if self._batch_supported:
+            c = self._ensure_client()
+            payload = _calculation_batch_payload(self.validate_requests, calc_lines, basis=basis, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x)
+            try:
+                resp = c.post("/v1/calculate:batch", content=_dumps(payload))
+                return self._decode_calculation_list(resp.content)
+            except VatifyError as e:
+                # No batch endpoint on this server: remember and fall back below
+                if e.status_code not in (404, 405):
+                    raise
+                self._batch_supported = False
+            except httpx.HTTPError as e:
+                raise VatifyError(f"Network error: {e}") from e
+        # No batch endpoint on this server: fan out single calls over the pool
+        def _one(line: CalcLine) -> _C:
+            return self.calculate(amount=line.amount, basis=basis, rate_type=line.rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=line.category_hint)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return list(pool.map(_one, calc_lines))
+
+    # Rates change rarely, so results are kept for cache_ttl seconds. Cache hits
+    # return the same object to every caller; treat it as read-only.
+    def rates(self, country_code: str) -> _R:
+        country_code = _normalize_country_code(country_code)
+        cached = _cache_get(self._rates_cache, country_code, self.cache_ttl)
+        if cached is not None:
+            return cached
+        result = self._fetch_rates(country_code)
+        self._rates_cache[country_code] = (time.monotonic(), result)
+        return result
+
+    def invalidate_rates_cache(self, country_code: Optional[str] = None) -> None:
+        if country_code is None:
+            self._rates_cache.clear()
+        else:
+            self._rates_cache.pop(_normalize_country_code(country_code), None)
+
+    def _rate_url(self, country_code: str) -> str:
+        url = self._rate_urls.get(country_code)
+        if url is None:
+            url = self._rate_urls[country_code] = f"/v1/rates/{country_code}"
+        return url
+
     # GET /v1/rates/{country_code}
-    def rates(self, country_code: str) -> Rate:
+    def _fetch_rates(self, country_code: str) -> _R:
         c = self._ensure_client()
         try:
-            resp = c.get(f"/v1/rates/{country_code}")
-            if resp.status_code >= 400:
-                raise VatifyError("Fetching rates failed", resp.status_code, resp.text)
-            data = resp.json()
-            # Accept either {"rates":[...]} or a raw list
-            items = data["rates"] if isinstance(data, dict) and "rates" in data else data
-            rates = Rates(country=items.get("country", country_code), standard_rate="", reduced_rates=[])
-            rates.country = items["country"]
-            rates.standard_rate = items["standard_rate"] 
-            rates.reduced_rates = [Rate(**r) for r in items["reduced_rates"]]
-            return rates
+            resp = c.get(self._rate_url(country_code))
+            return self._decode_rates(resp.content)
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
 
+@dataclass
+class Vatify(_PydanticDecoding, _VatifyBase[ValidationResult, CalculationResult, Rates]):
+    pass
+
 # ---------- Async Client ----------
+_AsyncSelf = TypeVar("_AsyncSelf", bound="_VatifyAsyncBase[Any, Any, Any]")
+
 @dataclass
-class VatifyAsync:
+class _VatifyAsyncBase(Generic[_V, _C, _R]):
     api_key: str
     base_url: str = DEFAULT_BASE_URL
     timeout: float = 10.0
+    max_connections: int = 100
+    max_keepalive: int = 20
+    validate_responses: bool = False
+    validate_requests: bool = False
+    cache_ttl: float = 3600.0
     _client: Optional[httpx.AsyncClient] = None
+    _headers: httpx.Headers = field(init=False, repr=False)
+    _headers_api_key: str = field(init=False, repr=False)
+    _batch_supported: bool = field(default=True, init=False, repr=False)
+    _rates_cache: Dict[str, Tuple[float, _R]] = field(default_factory=dict, init=False, repr=False)
+    _rate_urls: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _rates_locks: Dict[str, asyncio.Lock] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._headers = _default_headers(self.api_key)
+        self._headers_api_key = self.api_key
+
+    def _client_headers(self) -> httpx.Headers:
+        if self._headers_api_key != self.api_key:
+            self.__post_init__()
+        return self._headers
+
+    def _decode_validation(self, raw: bytes) -> _V:
+        raise NotImplementedError
+
+    def _decode_calculation(self, raw: bytes) -> _C:
+        raise NotImplementedError
+
+    def _decode_calculation_list(self, raw: bytes) -> List[_C]:
+        raise NotImplementedError
+
+    def _decode_rates(self, raw: bytes) -> _R:
+        raise NotImplementedError
 
     def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
-                headers={"Authorization": f"Bearer {self.api_key}", "User-Agent": "vatify-python/0.1"},
-                follow_redirects=True,
+                headers=self._client_headers(),
+                limits=_pool_limits(self.max_connections, self.max_keepalive),
+                http2=True,
+                event_hooks={"response": [_acheck_status]},
             )
         return self._client
 
@@ -149,35 +487,104 @@ class VatifyAsync:
             await self._client.aclose()
             self._client = None
 
-    async def validate_vat(self, vat_number: str) -> ValidationResult:
+    async def __aenter__(self: _AsyncSelf) -> _AsyncSelf:
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def validate_vat(self, vat_number: str) -> _V:
         c = self._ensure_client()
         try:
-            resp = await c.post("/v1/validate-vat", json={"vat_number": vat_number})
-            if resp.status_code >= 400:
-                raise VatifyError("Validation failed", resp.status_code, await resp.aread())
-            return ValidationResult(**resp.json())
+            resp = await c.post("/v1/validate-vat", content=_vat_body(vat_number))
+            return self._decode_validation(await resp.aread())
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
 
-    async def calculate(self, *, amount: float, basis: str, rate_type: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, category_hint: Optional[str] = None) -> CalculationResult:
+    # Concurrent requests multiplex over the pooled HTTP/2 connection
+    async def validate_vats(self, numbers: Iterable[str], *, concurrency: int = DEFAULT_CONCURRENCY) -> List[_V]:
+        _check_concurrency(concurrency)
+        self._ensure_client()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(vat_number: str) -> _V:
+            async with sem:
+                return await self.validate_vat(vat_number)
+
+        return list(await asyncio.gather(*[_one(n) for n in numbers]))
+
+    async def calculate(self, *, amount: float, basis: str, rate_type: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, category_hint: Optional[str] = None) -> _C:
         c = self._ensure_client()
-        payload = CalculationRequest(amount=amount, basis=basis, rate_type=rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=category_hint).model_dump()
+        payload = _calculation_payload(self.validate_requests, amount=amount, basis=basis, rate_type=rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=category_hint)
         try:
-            resp = await c.post("/v1/calculate", json=payload)
-            if resp.status_code >= 400:
-                raise VatifyError("Calculation failed", resp.status_code, await resp.aread())
-            return CalculationResult(**resp.json())
+            resp = await c.post("/v1/calculate", content=_dumps(payload))
+            return self._decode_calculation(await resp.aread())
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
 
-    async def rates(self, country_code: str) -> List[Rate]:
+    async def calculate_many(self, lines: Iterable[Union[CalcLine, Dict[str, Any]]], *, basis: str, supply_date: str, supplier: Supplier, customer: Supplier, supply_type: str, b2x: str, concurrency: int = DEFAULT_CONCURRENCY) -> List[_C]:
+        _check_concurrency(concurrency)
+        calc_lines = _calc_lines(lines)
+        if self._batch_supported:
+            c = self._ensure_client()
+            payload = _calculation_batch_payload(self.validate_requests, calc_lines, basis=basis, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x)
+            try:
+                resp = await c.post("/v1/calculate:batch", content=_dumps(payload))
+                return self._decode_calculation_list(await resp.aread())
+            except VatifyError as e:
+                # No batch endpoint on this server: remember and fall back below
+                if e.status_code not in (404, 405):
+                    raise
+                self._batch_supported = False
+            except httpx.HTTPError as e:
+                raise VatifyError(f"Network error: {e}") from e
+        # No batch endpoint on this server: fan out single calls over the pool
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(line: CalcLine) -> _C:
+            async with sem:
+                return await self.calculate(amount=line.amount, basis=basis, rate_type=line.rate_type, supply_date=supply_date, supplier=supplier, customer=customer, supply_type=supply_type, b2x=b2x, category_hint=line.category_hint)
+
+        return list(await asyncio.gather(*[_one(line) for line in calc_lines]))
+
+    # Cached like Vatify.rates(); the returned object is shared, treat it as read-only
+    async def rates(self, country_code: str) -> _R:
+        country_code = _normalize_country_code(country_code)
+        cached = _cache_get(self._rates_cache, country_code, self.cache_ttl)
+        if cached is not None:
+            return cached
+        # One in-flight fetch per country; concurrent callers wait and reuse it
+        lock = self._rates_locks.setdefault(country_code, asyncio.Lock())
+        async with lock:
+            cached = _cache_get(self._rates_cache, country_code, self.cache_ttl)
+            if cached is not None:
+                return cached
+            result = await self._fetch_rates(country_code)
+            self._rates_cache[country_code] = (time.monotonic(), result)
+            return result
+
+    def invalidate_rates_cache(self, country_code: Optional[str] = None) -> None:
+        if country_code is None:
+            self._rates_cache.clear()
+        else:
+            self._rates_cache.pop(_normalize_country_code(country_code), None)
+
+    def _rate_url(self, country_code: str) -> str:
+        url = self._rate_urls.get(country_code)
+        if url is None:
+            url = self._rate_urls[country_code] = f"/v1/rates/{country_code}"
+        return url
+
+    # GET /v1/rates/{country_code}
+    async def _fetch_rates(self, country_code: str) -> _R:
         c = self._ensure_client()
         try:
-            resp = await c.get(f"/v1/rates/{country_code}")
-            if resp.status_code >= 400:
-                raise VatifyError("Fetching rates failed", resp.status_code, await resp.aread())
-            data = resp.json()
-            items = data["rates"] if isinstance(data, dict) and "rates" in data else data
-            return [Rate(**r) for r in items]
+            resp = await c.get(self._rate_url(country_code))
+            return self._decode_rates(await resp.aread())
         except httpx.HTTPError as e:
             raise VatifyError(f"Network error: {e}") from e
+
+@dataclass
+class VatifyAsync(_PydanticDecoding, _VatifyAsyncBase[ValidationResult, CalculationResult, Rates]):
+    pass
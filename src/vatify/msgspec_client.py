@@ -0,0 +1,46 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import List
+
+try:
+    from . import _fast_models
+    from ._fast_models import FastCalculationResult, FastRate, FastRates, FastValidationResult
+except ImportError as e:  # msgspec not installed, see the "msgspec" extra
+    raise ImportError("vatify.msgspec_client requires msgspec: pip install 'vatify[msgspec]'") from e
+
+from .client import _VatifyAsyncBase, _VatifyBase
+
+# Same clients as vatify.Vatify/VatifyAsync, but responses decode straight from
+# bytes into msgspec Structs. msgspec always type-checks while decoding, so
+# validate_responses has no effect here. The Structs have no model_dump();
+# use msgspec.json.encode() or msgspec.to_builtins() instead.
+
+__all__ = [
+    "VatifyMsgspec",
+    "VatifyMsgspecAsync",
+    "FastValidationResult",
+    "FastCalculationResult",
+    "FastRate",
+    "FastRates",
+]
+
+class _MsgspecDecoding:
+    def _decode_validation(self, raw: bytes) -> FastValidationResult:
+        return _fast_models.decode_validation(raw)
+
+    def _decode_calculation(self, raw: bytes) -> FastCalculationResult:
+        return _fast_models.decode_calculation(raw)
+
+    def _decode_calculation_list(self, raw: bytes) -> List[FastCalculationResult]:
+        return _fast_models.decode_calculation_list(raw)
+
+    def _decode_rates(self, raw: bytes) -> FastRates:
+        return _fast_models.decode_rates(raw)
+
+@dataclass
+class VatifyMsgspec(_MsgspecDecoding, _VatifyBase[FastValidationResult, FastCalculationResult, FastRates]):
+    pass
+
+@dataclass
+class VatifyMsgspecAsync(_MsgspecDecoding, _VatifyAsyncBase[FastValidationResult, FastCalculationResult, FastRates]):
+    pass